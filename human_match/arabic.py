@@ -3,128 +3,176 @@
 from __future__ import annotations
 
 import re
+import unicodedata
+from functools import lru_cache
 
 from nameparser import HumanName
 
+from .utils import (
+    adjust_with_particles,
+    calculate_distance,
+    particle_regex,
+    split_at_particle,
+    strip_particles,
+)
+
 
 # Arabic particles that should be included with surnames
-ARABIC_PARTICLES = {
-    "al",  # الـ (the)
-    "el",  # variant of al
-    "ibn",  # ابن (son of)
-    "bin",  # بن (son of)
-    "bint",  # بنت (daughter of)
-    "abu",  # أبو (father of)
-    "um",  # أم (mother of)
-    "abd",  # عبد (servant of)
-    "عبد",  # Arabic script
-    "ابن",  # Arabic script
-    "بن",  # Arabic script
-    "بنت",  # Arabic script
-    "أبو",  # Arabic script
-    "أم",  # Arabic script
-    "الـ",  # Arabic script (the)
-}
+ARABIC_PARTICLES = frozenset(
+    {
+        "al",  # الـ (the)
+        "el",  # variant of al
+        "ibn",  # ابن (son of)
+        "bin",  # بن (son of)
+        "bint",  # بنت (daughter of)
+        "abu",  # أبو (father of)
+        "um",  # أم (mother of)
+        "abd",  # عبد (servant of)
+        "عبد",  # Arabic script
+        "ابن",  # Arabic script
+        "بن",  # Arabic script
+        "بنت",  # Arabic script
+        "أبو",  # Arabic script
+        "أم",  # Arabic script
+        "الـ",  # Arabic script (the)
+    }
+)
+
+_ARABIC_PARTICLE_RE = particle_regex(ARABIC_PARTICLES)
 
 # Arabic honorifics and titles
-ARABIC_HONORIFICS = {
-    "mr",
-    "mrs",
-    "miss",
-    "ms",
-    "dr",
-    "prof",
-    "sheikh",
-    "shaikh",
-    "sheikha",
-    "imam",
-    "hajj",
-    "hajja",
-    "sayyid",
-    "sayyida",
-    "amir",
-    "amira",
-    "malik",
-    "malika",
-    "sultan",
-    "sultana",
-    "أستاذ",  # Professor
-    "أستاذة",  # Professor (female)
-    "دكتور",  # Doctor
-    "دكتورة",  # Doctor (female)
-    "شيخ",  # Sheikh
-    "شيخة",  # Sheikha
-    "سيد",  # Sayyid
-    "سيدة",  # Sayyida
-    "حاج",  # Hajj
-    "حاجة",  # Hajja
-    "أمير",  # Amir
-    "أميرة",  # Amira
-    "ملك",  # Malik
-    "ملكة",  # Malika
-    "سلطان",  # Sultan
-    "سلطانة",  # Sultana
+ARABIC_HONORIFICS = frozenset(
+    {
+        "mr",
+        "mrs",
+        "miss",
+        "ms",
+        "dr",
+        "prof",
+        "sheikh",
+        "shaikh",
+        "sheikha",
+        "imam",
+        "hajj",
+        "hajja",
+        "sayyid",
+        "sayyida",
+        "amir",
+        "amira",
+        "malik",
+        "malika",
+        "sultan",
+        "sultana",
+        "أستاذ",  # Professor
+        "أستاذة",  # Professor (female)
+        "دكتور",  # Doctor
+        "دكتورة",  # Doctor (female)
+        "شيخ",  # Sheikh
+        "شيخة",  # Sheikha
+        "سيد",  # Sayyid
+        "سيدة",  # Sayyida
+        "حاج",  # Hajj
+        "حاجة",  # Hajja
+        "أمير",  # Amir
+        "أميرة",  # Amira
+        "ملك",  # Malik
+        "ملكة",  # Malika
+        "سلطان",  # Sultan
+        "سلطانة",  # Sultana
+    }
+)
+
+# Simple romanization mapping for common patterns
+ROMANIZATION_MAP = {
+    "محمد": "muhammad",
+    "أحمد": "ahmad",
+    "علي": "ali",
+    "عبدالله": "abdullah",
+    "عبدالرحمن": "abdulrahman",
+    "عبدالعزيز": "abdulaziz",
+    "خالد": "khalid",
+    "سالم": "salem",
+    "عمر": "omar",
+    "يوسف": "yusuf",
+    "إبراهيم": "ibrahim",
+    "حسن": "hassan",
+    "حسين": "hussein",
+    "فاطمة": "fatima",
+    "عائشة": "aisha",
+    "خديجة": "khadija",
+    "مريم": "mariam",
+    "زينب": "zainab",
+    "صفية": "safiya",
 }
 
+_ROMANIZATION_PRIORITY = {arabic: i for i, arabic in enumerate(ROMANIZATION_MAP)}
+_ROMANIZATION_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, ROMANIZATION_MAP)) + "))"
+)
+
+_ARABIC_RE = re.compile(
+    r"[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFC]"
+)
+
+# Single-pass normalization table: drop diacritics (tashkeel) and tatweel,
+# fold Alef/Yeh variants and Teh Marbuta to their standard forms
+_ARABIC_TRANSLATE = str.maketrans(
+    {
+        **dict.fromkeys(map(chr, range(0x064B, 0x0660))),
+        "\u0670": None,
+        "\u0640": None,
+        "أ": "ا",
+        "إ": "ا",
+        "آ": "ا",
+        "ة": "ه",
+        "ى": "ي",
+        "ئ": "ي",
+    }
+)
+
 
+@lru_cache(maxsize=65536)
 def is_arabic_text(text: str) -> bool:
     """Check if text contains Arabic characters."""
-    return bool(re.search(r"[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF]", text))
+    # ASCII text cannot contain Arabic; str.isascii() is a flag check
+    if text.isascii():
+        return False
+    return bool(_ARABIC_RE.search(text))
 
 
+@lru_cache(maxsize=65536)
 def normalize_arabic_text(text: str) -> str:
     """Normalize Arabic text by removing diacritics and standardizing forms."""
     if not text:
         return text
 
-    # Remove Arabic diacritics (tashkeel)
-    normalized = re.sub(r"[\u064B-\u065F\u0670\u0640]", "", text)
-
-    # Normalize Arabic letters to standard forms
-    # Convert different forms of Alef to standard Alef
-    normalized = re.sub(r"[أإآ]", "ا", normalized)
+    # Fold presentation forms and compatibility characters to their base letters
+    normalized = unicodedata.normalize("NFKC", text)
 
-    # Convert Teh Marbuta to Heh
-    normalized = re.sub(r"ة", "ه", normalized)
-
-    # Convert different forms of Yeh to standard Yeh
-    normalized = re.sub(r"[ىئ]", "ي", normalized)
+    # Remove diacritics and normalize letters to standard forms
+    normalized = normalized.translate(_ARABIC_TRANSLATE)
 
     # Remove extra spaces
-    normalized = re.sub(r"\s+", " ", normalized.strip())
+    normalized = " ".join(normalized.split())
 
     return normalized
 
 
+@lru_cache(maxsize=65536)
 def romanize_arabic_name(name: str) -> str:
     """Convert common Arabic name patterns to romanized equivalents."""
-    # Simple romanization mapping for common patterns
-    romanization_map = {
-        "محمد": "muhammad",
-        "أحمد": "ahmad",
-        "علي": "ali",
-        "عبدالله": "abdullah",
-        "عبدالرحمن": "abdulrahman",
-        "عبدالعزيز": "abdulaziz",
-        "خالد": "khalid",
-        "سالم": "salem",
-        "عمر": "omar",
-        "يوسف": "yusuf",
-        "إبراهيم": "ibrahim",
-        "حسن": "hassan",
-        "حسين": "hussein",
-        "فاطمة": "fatima",
-        "عائشة": "aisha",
-        "خديجة": "khadija",
-        "مريم": "mariam",
-        "زينب": "zainab",
-        "صفية": "safiya",
-    }
-
     name_lower = name.lower()
-    for arabic, roman in romanization_map.items():
-        if arabic in name_lower:
-            return roman
+
+    # Whole-token names resolve with a single lookup
+    roman = ROMANIZATION_MAP.get(name_lower)
+    if roman is not None:
+        return roman
+
+    # Otherwise the earliest map entry found anywhere in the name wins; the
+    # lookahead reports the highest-priority entry starting at each position
+    matches = _ROMANIZATION_RE.findall(name_lower)
+    if matches:
+        return ROMANIZATION_MAP[min(matches, key=_ROMANIZATION_PRIORITY.__getitem__)]
 
     return name
 
@@ -135,47 +183,19 @@ def adjust_arabic_parsing(parsed: HumanName, name: str) -> HumanName:
     if is_arabic_text(name):
         words = name.split()
 
-        # Handle Arabic particles
-        for i, word in enumerate(words):
-            word_lower = word.lower()
-            normalized_word = normalize_arabic_text(word_lower)
-
-            if normalized_word in ARABIC_PARTICLES or word_lower in ARABIC_PARTICLES:
-                if i > 0:  # Particle not at the beginning
-                    # Everything from the particle onwards is the surname
-                    last_part = " ".join(words[i:])
-                    parsed.last = last_part
-                    # Everything before the particle is first/middle
-                    if i == 1:
-                        parsed.first = words[0]
-                        parsed.middle = ""
-                    elif i == 2:
-                        parsed.first = words[0]
-                        parsed.middle = words[1]
-                    else:
-                        parsed.first = " ".join(words[: i - 1])
-                        parsed.middle = words[i - 1]
-                    break
+        # Handle Arabic particles (not at the beginning), checking the raw
+        # word before paying for normalization
+        for i in range(1, len(words)):
+            word_lower = words[i].lower()
+            if (
+                word_lower in ARABIC_PARTICLES
+                or normalize_arabic_text(word_lower) in ARABIC_PARTICLES
+            ):
+                split_at_particle(parsed, words, i)
+                break
     else:
         # Handle romanized Arabic names
-        words = name.split()
-        if len(words) >= 3:
-            for i, word in enumerate(words):
-                if word.lower() in ARABIC_PARTICLES and i > 0:
-                    # Everything from the particle onwards is the surname
-                    last_part = " ".join(words[i:])
-                    parsed.last = last_part
-                    # Everything before the particle is first/middle
-                    if i == 1:
-                        parsed.first = words[0]
-                        parsed.middle = ""
-                    elif i == 2:
-                        parsed.first = words[0]
-                        parsed.middle = words[1]
-                    else:
-                        parsed.first = " ".join(words[: i - 1])
-                        parsed.middle = words[i - 1]
-                    break
+        adjust_with_particles(parsed, name, ARABIC_PARTICLES)
 
     return parsed
 
@@ -185,68 +205,69 @@ def normalize_arabic_surname(surname: str) -> str:
     if is_arabic_text(surname):
         # Normalize Arabic text
         normalized = normalize_arabic_text(surname.lower())
-        words = normalized.split()
-
-        # Remove particles
-        filtered_words = []
-        for word in words:
-            if word not in ARABIC_PARTICLES:
-                filtered_words.append(word)
-
-        # If we removed everything, keep the original
-        if not filtered_words:
-            return normalized
-
-        return " ".join(filtered_words)
+        # Remove particles, keeping the original if nothing else is left
+        return strip_particles(normalized, _ARABIC_PARTICLE_RE)
     else:
         # Handle romanized Arabic names
         normalized = surname.lower()
-        words = normalized.split()
+        # Remove particles, keeping the original if nothing else is left
+        return strip_particles(normalized, _ARABIC_PARTICLE_RE)
 
-        # Remove particles from the beginning and keep track of the core name
-        filtered_words = []
-        for word in words:
-            if word not in ARABIC_PARTICLES:
-                filtered_words.append(word)
 
-        # If we removed everything, keep the original
-        if not filtered_words:
-            return normalized
+def _prepare_arabic_name(name: str) -> tuple[str, bool, str, str]:
+    """Precompute the script check, normalized and romanized forms of a name."""
+    if is_arabic_text(name):
+        return name, True, normalize_arabic_text(name), romanize_arabic_name(name)
+    return name, False, name, name
 
-        return " ".join(filtered_words)
 
+def _prepared_arabic_similarity(
+    prepared1: tuple[str, bool, str, str], prepared2: tuple[str, bool, str, str]
+) -> float:
+    """Compare two names prepared by ``_prepare_arabic_name``."""
+    name1, arabic1, norm1, romanized1 = prepared1
+    name2, arabic2, norm2, romanized2 = prepared2
 
-def calculate_arabic_similarity(name1: str, name2: str) -> float:
-    """Calculate similarity for Arabic names with special handling for script variations."""
     # If both names are in Arabic script, use normalized comparison
-    if is_arabic_text(name1) and is_arabic_text(name2):
-        norm1 = normalize_arabic_text(name1)
-        norm2 = normalize_arabic_text(name2)
-
+    if arabic1 and arabic2:
         if norm1 == norm2:
             return 1.0
 
         # Try basic similarity on normalized text
-        from .utils import calculate_distance
-
         return calculate_distance(norm1, norm2)
 
     # If one is Arabic and one is romanized, try romanization matching
-    elif is_arabic_text(name1) and not is_arabic_text(name2):
-        romanized1 = romanize_arabic_name(name1)
+    elif arabic1 and not arabic2:
         if romanized1 and romanized1 != name1:
-            from .utils import calculate_distance
-
             return calculate_distance(romanized1, name2.lower())
 
-    elif not is_arabic_text(name1) and is_arabic_text(name2):
-        romanized2 = romanize_arabic_name(name2)
+    elif not arabic1 and arabic2:
         if romanized2 and romanized2 != name2:
-            from .utils import calculate_distance
-
             return calculate_distance(name1.lower(), romanized2)
 
     # Default to standard comparison
-    from .utils import calculate_distance
-
     return calculate_distance(name1, name2)
+
+
+@lru_cache(maxsize=65536)
+def calculate_arabic_similarity(name1: str, name2: str) -> float:
+    """Calculate similarity for Arabic names with special handling for script variations."""
+    return _prepared_arabic_similarity(
+        _prepare_arabic_name(name1), _prepare_arabic_name(name2)
+    )
+
+
+def batch_arabic_similarity(
+    queries: list[str], candidates: list[str]
+) -> list[list[float]]:
+    """Calculate Arabic name similarity for every query against every candidate.
+
+    Each name is normalized and romanized once rather than once per pair, and
+    the pairwise results bypass the ``calculate_arabic_similarity`` cache.
+    Row ``i`` holds the scores of ``queries[i]`` against each candidate.
+    """
+    prepared_candidates = [_prepare_arabic_name(c) for c in candidates]
+    return [
+        [_prepared_arabic_similarity(prepared, c) for c in prepared_candidates]
+        for prepared in map(_prepare_arabic_name, queries)
+    ]
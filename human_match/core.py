@@ -30,7 +30,7 @@ class Gender(Enum):
     UNKNOWN = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NameComponents:
     """Structured representation of name components."""
 
@@ -2,24 +2,89 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
+import threading
+from collections.abc import Callable
 from pathlib import Path
 
 from .core import Language
-from .english import ENGLISH_HONORIFICS
-from .french import FRENCH_HONORIFICS
-from .german import GERMAN_HONORIFICS
-from .italian import ITALIAN_HONORIFICS
-from .spanish import SPANISH_HONORIFICS
-from .portuguese import PORTUGUESE_HONORIFICS
-from .arabic import ARABIC_HONORIFICS
 
 
-@lru_cache(maxsize=1024)
-def load_diminutives(language: Language, data_dir: Path) -> dict[str, list[str]]:
+# Loaders for the built-in honorifics; each imports its module on first use
+def _english_honorifics() -> frozenset[str]:
+    from .english import ENGLISH_HONORIFICS
+
+    return ENGLISH_HONORIFICS
+
+
+def _french_honorifics() -> frozenset[str]:
+    from .french import FRENCH_HONORIFICS
+
+    return FRENCH_HONORIFICS
+
+
+def _german_honorifics() -> frozenset[str]:
+    from .german import GERMAN_HONORIFICS
+
+    return GERMAN_HONORIFICS
+
+
+def _italian_honorifics() -> frozenset[str]:
+    from .italian import ITALIAN_HONORIFICS
+
+    return ITALIAN_HONORIFICS
+
+
+def _spanish_honorifics() -> frozenset[str]:
+    from .spanish import SPANISH_HONORIFICS
+
+    return SPANISH_HONORIFICS
+
+
+def _portuguese_honorifics() -> frozenset[str]:
+    from .portuguese import PORTUGUESE_HONORIFICS
+
+    return PORTUGUESE_HONORIFICS
+
+
+def _arabic_honorifics() -> frozenset[str]:
+    from .arabic import ARABIC_HONORIFICS
+
+    return ARABIC_HONORIFICS
+
+
+_HONORIFICS_LOADERS: dict[Language, Callable[[], frozenset[str]]] = {
+    Language.ENGLISH: _english_honorifics,
+    Language.FRENCH: _french_honorifics,
+    Language.GERMAN: _german_honorifics,
+    Language.ITALIAN: _italian_honorifics,
+    Language.SPANISH: _spanish_honorifics,
+    Language.PORTUGUESE: _portuguese_honorifics,
+    Language.ARABIC: _arabic_honorifics,
+}
+
+# Loaded data keyed by (language, data directory); each file is read only once
+_DIMINUTIVES_CACHE: dict[tuple[Language, str], dict[str, frozenset[str]]] = {}
+_HONORIFICS_CACHE: dict[tuple[Language, str], frozenset[str]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def load_diminutives(language: Language, data_dir: Path) -> dict[str, frozenset[str]]:
     """Load diminutives mapping for a language."""
+    key = (language, str(data_dir))
+    diminutives = _DIMINUTIVES_CACHE.get(key)
+    if diminutives is None:
+        with _CACHE_LOCK:
+            diminutives = _DIMINUTIVES_CACHE.get(key)
+            if diminutives is None:
+                diminutives = _read_diminutives(language, data_dir)
+                _DIMINUTIVES_CACHE[key] = diminutives
+    return diminutives
+
+
+def _read_diminutives(language: Language, data_dir: Path) -> dict[str, frozenset[str]]:
+    """Parse the diminutives file for a language."""
     file_path = data_dir / "diminuitives" / language.value
-    diminutives = {}
+    variants: dict[str, set[str]] = {}
 
     if file_path.exists():
         with open(file_path, encoding="utf-8") as f:
@@ -28,36 +93,45 @@ def load_diminutives(language: Language, data_dir: Path) -> dict[str, list[str]]
                 if line and "," in line:
                     parts = [part.strip().lower() for part in line.split(",")]
                     if len(parts) >= 2:
-                        # All names in the line are equivalent - create bidirectional mapping
+                        # All names in the line are equivalent - each name's
+                        # class is itself plus every name it shares a line with
                         for name in parts:
-                            # Each name maps to all other names in the same line
-                            variants = [n for n in parts if n != name]
-                            if name not in diminutives:
-                                diminutives[name] = variants
-                            else:
-                                # Merge variants without duplicates
-                                existing = set(diminutives[name])
-                                existing.update(variants)
-                                diminutives[name] = list(existing)
+                            variants.setdefault(name, set()).update(parts)
 
-    return diminutives
+    # Names with identical classes share a single frozenset
+    classes: dict[frozenset[str], frozenset[str]] = {}
+    shared: dict[str, frozenset[str]] = {}
+    for name, names in variants.items():
+        cls = frozenset(names)
+        shared[name] = classes.setdefault(cls, cls)
+    return shared
 
 
-@lru_cache(maxsize=1024)
-def load_honorifics(language: Language, data_dir: Path) -> set[str]:
+def load_honorifics(language: Language, data_dir: Path) -> frozenset[str]:
     """Load honorifics/titles for a language."""
+    key = (language, str(data_dir))
+    honorifics = _HONORIFICS_CACHE.get(key)
+    if honorifics is None:
+        with _CACHE_LOCK:
+            honorifics = _HONORIFICS_CACHE.get(key)
+            if honorifics is None:
+                honorifics = _read_honorifics(language, data_dir)
+                _HONORIFICS_CACHE[key] = honorifics
+    return honorifics
+
+
+def _builtin_honorifics(language: Language) -> frozenset[str]:
+    """Import the built-in honorifics for a language from its module."""
+    loader = _HONORIFICS_LOADERS.get(language)
+    if loader is None:
+        return frozenset()
+    return loader()
+
+
+def _read_honorifics(language: Language, data_dir: Path) -> frozenset[str]:
+    """Combine built-in honorifics with those from the honorifics file."""
     # Start with built-in honorifics
-    honorifics_map = {
-        Language.ENGLISH: ENGLISH_HONORIFICS.copy(),
-        Language.FRENCH: FRENCH_HONORIFICS.copy(),
-        Language.GERMAN: GERMAN_HONORIFICS.copy(),
-        Language.ITALIAN: ITALIAN_HONORIFICS.copy(),
-        Language.SPANISH: SPANISH_HONORIFICS.copy(),
-        Language.PORTUGUESE: PORTUGUESE_HONORIFICS.copy(),
-        Language.ARABIC: ARABIC_HONORIFICS.copy(),
-    }
-
-    honorifics = honorifics_map.get(language, set())
+    honorifics = set(_builtin_honorifics(language))
 
     # Load additional honorifics from file
     file_path = data_dir / "honorifics" / language.value
@@ -70,15 +144,11 @@ def load_honorifics(language: Language, data_dir: Path) -> set[str]:
                     # Add variant without periods
                     honorifics.add(title.lower().replace(".", ""))
 
-    return honorifics
+    return frozenset(honorifics)
 
 
-def expand_diminutives(name: str, language: Language, data_dir: Path) -> list[str]:
+def expand_diminutives(name: str, language: Language, data_dir: Path) -> frozenset[str]:
     """Generate possible full names from diminutives."""
-    diminutives = load_diminutives(language, data_dir)
     name_lower = name.lower()
-
-    if name_lower in diminutives:
-        return [name_lower] + diminutives[name_lower]
-
-    return [name_lower]
+    diminutives = load_diminutives(language, data_dir)
+    return diminutives.get(name_lower) or frozenset((name_lower,))
@@ -6,33 +6,35 @@ from nameparser import HumanName
 
 
 # English particles that should be included with surnames
-ENGLISH_PARTICLES = {"mc", "mac", "o'", "of", "the"}
+ENGLISH_PARTICLES = frozenset({"mc", "mac", "o'", "of", "the"})
 
 # English honorifics and titles
-ENGLISH_HONORIFICS = {
-    "mr",
-    "mr.",
-    "mrs",
-    "mrs.",
-    "miss",
-    "ms",
-    "ms.",
-    "dr",
-    "dr.",
-    "prof",
-    "prof.",
-    "professor",
-    "sir",
-    "lady",
-    "lord",
-    "dame",
-    "rev",
-    "reverend",
-    "captain",
-    "colonel",
-    "major",
-    "general",
-}
+ENGLISH_HONORIFICS = frozenset(
+    {
+        "mr",
+        "mr.",
+        "mrs",
+        "mrs.",
+        "miss",
+        "ms",
+        "ms.",
+        "dr",
+        "dr.",
+        "prof",
+        "prof.",
+        "professor",
+        "sir",
+        "lady",
+        "lord",
+        "dame",
+        "rev",
+        "reverend",
+        "captain",
+        "colonel",
+        "major",
+        "general",
+    }
+)
 
 
 def adjust_english_parsing(parsed: HumanName, name: str) -> HumanName:
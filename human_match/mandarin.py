@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 from nameparser import HumanName
 
@@ -16,537 +17,459 @@ except ImportError:
 
 # Common Chinese surnames in simplified and traditional characters
 # Top 100 most common Chinese surnames
-CHINESE_SURNAMES = {
-    # Simplified characters
-    "王",
-    "李",
-    "张",
-    "刘",
-    "陈",
-    "杨",
-    "黄",
-    "赵",
-    "周",
-    "吴",
-    "徐",
-    "孙",
-    "朱",
-    "马",
-    "胡",
-    "郭",
-    "林",
-    "何",
-    "高",
-    "梁",
-    "郑",
-    "罗",
-    "宋",
-    "谢",
-    "唐",
-    "韩",
-    "曹",
-    "许",
-    "邓",
-    "萧",
-    "冯",
-    "曾",
-    "程",
-    "蔡",
-    "彭",
-    "潘",
-    "袁",
-    "于",
-    "董",
-    "余",
-    "苏",
-    "叶",
-    "吕",
-    "魏",
-    "蒋",
-    "田",
-    "杜",
-    "丁",
-    "沈",
-    "姜",
-    "范",
-    "江",
-    "傅",
-    "钟",
-    "卢",
-    "汪",
-    "戴",
-    "崔",
-    "任",
-    "陆",
-    "廖",
-    "姚",
-    "方",
-    "金",
-    "邱",
-    "夏",
-    "谭",
-    "韦",
-    "贾",
-    "邹",
-    "石",
-    "熊",
-    "孟",
-    "秦",
-    "阎",
-    "薛",
-    "侯",
-    "雷",
-    "白",
-    "龙",
-    "段",
-    "郝",
-    "孔",
-    "邵",
-    "史",
-    "毛",
-    "常",
-    "万",
-    "顾",
-    "赖",
-    "武",
-    "康",
-    "贺",
-    "严",
-    "尹",
-    "钱",
-    "施",
-    "牛",
-    "洪",
-    "龚",
-    # Traditional characters (some different from simplified)
-    "張",
-    "劉",
-    "陳",
-    "楊",
-    "黃",
-    "趙",
-    "週",
-    "吳",
-    "徐",
-    "孫",
-    "朱",
-    "馬",
-    "胡",
-    "郭",
-    "林",
-    "何",
-    "高",
-    "梁",
-    "鄭",
-    "羅",
-    "宋",
-    "謝",
-    "唐",
-    "韓",
-    "曹",
-    "許",
-    "鄧",
-    "蕭",
-    "馮",
-    "曾",
-    "程",
-    "蔡",
-    "彭",
-    "潘",
-    "袁",
-    "於",
-    "董",
-    "餘",
-    "蘇",
-    "葉",
-    "呂",
-    "魏",
-    "蔣",
-    "田",
-    "杜",
-    "丁",
-    "沈",
-    "姜",
-    "範",
-    "江",
-    "傅",
-    "鍾",
-    "盧",
-    "汪",
-    "戴",
-    "崔",
-    "任",
-    "陸",
-    "廖",
-    "姚",
-    "方",
-    "金",
-    "邱",
-    "夏",
-    "譚",
-    "韋",
-    "賈",
-    "鄒",
-    "石",
-    "熊",
-    "孟",
-    "秦",
-    "閻",
-    "薛",
-    "侯",
-    "雷",
-    "白",
-    "龍",
-    "段",
-    "郝",
-    "孔",
-    "邵",
-    "史",
-    "毛",
-    "常",
-    "萬",
-    "顧",
-    "賴",
-    "武",
-    "康",
-    "賀",
-    "嚴",
-    "尹",
-    "錢",
-    "施",
-    "牛",
-    "洪",
-    "龔",
-}
+CHINESE_SURNAMES = frozenset(
+    {
+        # Simplified characters
+        "王",
+        "李",
+        "张",
+        "刘",
+        "陈",
+        "杨",
+        "黄",
+        "赵",
+        "周",
+        "吴",
+        "徐",
+        "孙",
+        "朱",
+        "马",
+        "胡",
+        "郭",
+        "林",
+        "何",
+        "高",
+        "梁",
+        "郑",
+        "罗",
+        "宋",
+        "谢",
+        "唐",
+        "韩",
+        "曹",
+        "许",
+        "邓",
+        "萧",
+        "冯",
+        "曾",
+        "程",
+        "蔡",
+        "彭",
+        "潘",
+        "袁",
+        "于",
+        "董",
+        "余",
+        "苏",
+        "叶",
+        "吕",
+        "魏",
+        "蒋",
+        "田",
+        "杜",
+        "丁",
+        "沈",
+        "姜",
+        "范",
+        "江",
+        "傅",
+        "钟",
+        "卢",
+        "汪",
+        "戴",
+        "崔",
+        "任",
+        "陆",
+        "廖",
+        "姚",
+        "方",
+        "金",
+        "邱",
+        "夏",
+        "谭",
+        "韦",
+        "贾",
+        "邹",
+        "石",
+        "熊",
+        "孟",
+        "秦",
+        "阎",
+        "薛",
+        "侯",
+        "雷",
+        "白",
+        "龙",
+        "段",
+        "郝",
+        "孔",
+        "邵",
+        "史",
+        "毛",
+        "常",
+        "万",
+        "顾",
+        "赖",
+        "武",
+        "康",
+        "贺",
+        "严",
+        "尹",
+        "钱",
+        "施",
+        "牛",
+        "洪",
+        "龚",
+        # Traditional characters (some different from simplified)
+        "張",
+        "劉",
+        "陳",
+        "楊",
+        "黃",
+        "趙",
+        "週",
+        "吳",
+        "孫",
+        "馬",
+        "鄭",
+        "羅",
+        "謝",
+        "韓",
+        "許",
+        "鄧",
+        "蕭",
+        "馮",
+        "於",
+        "餘",
+        "蘇",
+        "葉",
+        "呂",
+        "蔣",
+        "範",
+        "鍾",
+        "盧",
+        "陸",
+        "譚",
+        "韋",
+        "賈",
+        "鄒",
+        "閻",
+        "龍",
+        "萬",
+        "顧",
+        "賴",
+        "賀",
+        "嚴",
+        "錢",
+        "龔",
+    }
+)
 
 # Romanized versions of common Chinese surnames
-ROMANIZED_SURNAMES = {
-    "wang",
-    "li",
-    "zhang",
-    "liu",
-    "chen",
-    "yang",
-    "huang",
-    "zhao",
-    "zhou",
-    "wu",
-    "xu",
-    "sun",
-    "zhu",
-    "ma",
-    "hu",
-    "guo",
-    "lin",
-    "he",
-    "gao",
-    "liang",
-    "zheng",
-    "luo",
-    "song",
-    "xie",
-    "tang",
-    "han",
-    "cao",
-    "xu",
-    "deng",
-    "xiao",
-    "feng",
-    "zeng",
-    "cheng",
-    "cai",
-    "peng",
-    "pan",
-    "yuan",
-    "yu",
-    "dong",
-    "yu",
-    "su",
-    "ye",
-    "lv",
-    "wei",
-    "jiang",
-    "tian",
-    "du",
-    "ding",
-    "shen",
-    "jiang",
-    "fan",
-    "jiang",
-    "fu",
-    "zhong",
-    "lu",
-    "wang",
-    "dai",
-    "cui",
-    "ren",
-    "lu",
-    "liao",
-    "yao",
-    "fang",
-    "jin",
-    "qiu",
-    "xia",
-    "tan",
-    "wei",
-    "jia",
-    "zou",
-    "shi",
-    "xiong",
-    "meng",
-    "qin",
-    "yan",
-    "xue",
-    "hou",
-    "lei",
-    "bai",
-    "long",
-    "duan",
-    "hao",
-    "kong",
-    "shao",
-    "shi",
-    "mao",
-    "chang",
-    "wan",
-    "gu",
-    "lai",
-    "wu",
-    "kang",
-    "he",
-    "yan",
-    "yin",
-    "qian",
-    "shi",
-    "niu",
-    "hong",
-    "gong",
-    # Alternative romanizations
-    "wong",
-    "lee",
-    "chang",
-    "lau",
-    "chan",
-    "yeung",
-    "wong",
-    "chiu",
-    "chow",
-    "ng",
-    "tsui",
-    "soon",
-    "chu",
-    "mah",
-    "woo",
-    "kwok",
-    "lam",
-    "ho",
-    "ko",
-    "leung",
-    "cheng",
-    "law",
-    "sung",
-    "tse",
-    "tong",
-    "hon",
-    "tso",
-    "hui",
-    "tang",
-    "siu",
-    "fung",
-    "tsang",
-    "ching",
-    "choy",
-    "pang",
-    "poon",
-    "yuen",
-    "yue",
-    "tung",
-    "yue",
-    "so",
-    "yip",
-    "lui",
-    "wai",
-    "cheung",
-    "tin",
-    "to",
-    "ting",
-    "sum",
-    "keung",
-    "fan",
-    "kong",
-    "foo",
-    "chung",
-    "lou",
-    "wong",
-    "toy",
-    "chui",
-    "yam",
-    "luk",
-    "liu",
-    "yiu",
-    "fong",
-    "kam",
-    "yau",
-    "har",
-    "tam",
-    "wai",
-    "kar",
-    "chau",
-    "sek",
-    "hung",
-    "mang",
-    "chun",
-    "yim",
-    "sit",
-    "hau",
-    "lui",
-    "pak",
-    "lung",
-    "tuen",
-    "ho",
-    "hung",
-    "siu",
-    "see",
-    "mou",
-    "sheung",
-    "man",
-    "koo",
-    "loi",
-    "mo",
-    "hong",
-    "hor",
-    "yim",
-    "wan",
-    "chin",
-    "see",
-    "ngau",
-    "hung",
-    "kung",
-}
+ROMANIZED_SURNAMES = frozenset(
+    {
+        "wang",
+        "li",
+        "zhang",
+        "liu",
+        "chen",
+        "yang",
+        "huang",
+        "zhao",
+        "zhou",
+        "wu",
+        "xu",
+        "sun",
+        "zhu",
+        "ma",
+        "hu",
+        "guo",
+        "lin",
+        "he",
+        "gao",
+        "liang",
+        "zheng",
+        "luo",
+        "song",
+        "xie",
+        "tang",
+        "han",
+        "cao",
+        "deng",
+        "xiao",
+        "feng",
+        "zeng",
+        "cheng",
+        "cai",
+        "peng",
+        "pan",
+        "yuan",
+        "yu",
+        "dong",
+        "su",
+        "ye",
+        "lv",
+        "wei",
+        "jiang",
+        "tian",
+        "du",
+        "ding",
+        "shen",
+        "fan",
+        "fu",
+        "zhong",
+        "lu",
+        "dai",
+        "cui",
+        "ren",
+        "liao",
+        "yao",
+        "fang",
+        "jin",
+        "qiu",
+        "xia",
+        "tan",
+        "jia",
+        "zou",
+        "shi",
+        "xiong",
+        "meng",
+        "qin",
+        "yan",
+        "xue",
+        "hou",
+        "lei",
+        "bai",
+        "long",
+        "duan",
+        "hao",
+        "kong",
+        "shao",
+        "mao",
+        "chang",
+        "wan",
+        "gu",
+        "lai",
+        "kang",
+        "yin",
+        "qian",
+        "niu",
+        "hong",
+        "gong",
+        # Alternative romanizations
+        "wong",
+        "lee",
+        "lau",
+        "chan",
+        "yeung",
+        "chiu",
+        "chow",
+        "ng",
+        "tsui",
+        "soon",
+        "chu",
+        "mah",
+        "woo",
+        "kwok",
+        "lam",
+        "ho",
+        "ko",
+        "leung",
+        "law",
+        "sung",
+        "tse",
+        "tong",
+        "hon",
+        "tso",
+        "hui",
+        "siu",
+        "fung",
+        "tsang",
+        "ching",
+        "choy",
+        "pang",
+        "poon",
+        "yuen",
+        "yue",
+        "tung",
+        "so",
+        "yip",
+        "lui",
+        "wai",
+        "cheung",
+        "tin",
+        "to",
+        "ting",
+        "sum",
+        "keung",
+        "foo",
+        "chung",
+        "lou",
+        "toy",
+        "chui",
+        "yam",
+        "luk",
+        "yiu",
+        "fong",
+        "kam",
+        "yau",
+        "har",
+        "tam",
+        "kar",
+        "chau",
+        "sek",
+        "hung",
+        "mang",
+        "chun",
+        "yim",
+        "sit",
+        "hau",
+        "pak",
+        "lung",
+        "tuen",
+        "see",
+        "mou",
+        "sheung",
+        "man",
+        "koo",
+        "loi",
+        "mo",
+        "hor",
+        "chin",
+        "ngau",
+        "kung",
+    }
+)
 
 # Common Chinese given names (simplified characters)
-CHINESE_GIVEN_NAMES = {
-    # Male names
-    "伟",
-    "强",
-    "明",
-    "华",
-    "建",
-    "国",
-    "军",
-    "峰",
-    "磊",
-    "勇",
-    "涛",
-    "超",
-    "斌",
-    "辉",
-    "刚",
-    "鹏",
-    "飞",
-    "凯",
-    "杰",
-    "亮",
-    "龙",
-    "志",
-    "鑫",
-    "海",
-    "东",
-    "南",
-    "阳",
-    "春",
-    "浩",
-    "天",
-    "文",
-    "武",
-    "康",
-    "健",
-    "宏",
-    "伟",
-    "俊",
-    "豪",
-    "凌",
-    "博",
-    # Female names
-    "丽",
-    "红",
-    "霞",
-    "燕",
-    "娟",
-    "芳",
-    "梅",
-    "玲",
-    "静",
-    "敏",
-    "艳",
-    "萍",
-    "莉",
-    "兰",
-    "英",
-    "慧",
-    "雪",
-    "琳",
-    "颖",
-    "洁",
-    "秀",
-    "美",
-    "花",
-    "月",
-    "宁",
-    "雨",
-    "婷",
-    "晶",
-    "欣",
-    "倩",
-    "娜",
-    "瑶",
-    "蕾",
-    "薇",
-    "珍",
-    "琴",
-    "云",
-    "凤",
-    "露",
-    "佳",
-}
+CHINESE_GIVEN_NAMES = frozenset(
+    {
+        # Male names
+        "伟",
+        "强",
+        "明",
+        "华",
+        "建",
+        "国",
+        "军",
+        "峰",
+        "磊",
+        "勇",
+        "涛",
+        "超",
+        "斌",
+        "辉",
+        "刚",
+        "鹏",
+        "飞",
+        "凯",
+        "杰",
+        "亮",
+        "龙",
+        "志",
+        "鑫",
+        "海",
+        "东",
+        "南",
+        "阳",
+        "春",
+        "浩",
+        "天",
+        "文",
+        "武",
+        "康",
+        "健",
+        "宏",
+        "俊",
+        "豪",
+        "凌",
+        "博",
+        # Female names
+        "丽",
+        "红",
+        "霞",
+        "燕",
+        "娟",
+        "芳",
+        "梅",
+        "玲",
+        "静",
+        "敏",
+        "艳",
+        "萍",
+        "莉",
+        "兰",
+        "英",
+        "慧",
+        "雪",
+        "琳",
+        "颖",
+        "洁",
+        "秀",
+        "美",
+        "花",
+        "月",
+        "宁",
+        "雨",
+        "婷",
+        "晶",
+        "欣",
+        "倩",
+        "娜",
+        "瑶",
+        "蕾",
+        "薇",
+        "珍",
+        "琴",
+        "云",
+        "凤",
+        "露",
+        "佳",
+    }
+)
 
 # Honorifics and titles in Chinese
-CHINESE_HONORIFICS = {
-    "先生",
-    "女士",
-    "小姐",
-    "太太",
-    "夫人",
-    "老师",
-    "教授",
-    "博士",
-    "医生",
-    "护士",
-    "工程师",
-    "律师",
-    "经理",
-    "主任",
-    "董事",
-    "总裁",
-    "mister",
-    "mr",
-    "mrs",
-    "miss",
-    "ms",
-    "dr",
-    "prof",
-    "professor",
-}
+CHINESE_HONORIFICS = frozenset(
+    {
+        "先生",
+        "女士",
+        "小姐",
+        "太太",
+        "夫人",
+        "老师",
+        "教授",
+        "博士",
+        "医生",
+        "护士",
+        "工程师",
+        "律师",
+        "经理",
+        "主任",
+        "董事",
+        "总裁",
+        "mister",
+        "mr",
+        "mrs",
+        "miss",
+        "ms",
+        "dr",
+        "prof",
+        "professor",
+    }
+)
+
+
+_CHINESE_CHAR_RE = re.compile(r"[\u4e00-\u9fff\u3400-\u4dbf]")
 
 
 def is_chinese_character(char: str) -> bool:
     """Check if a character is a Chinese character."""
-    return bool(re.match(r"[\u4e00-\u9fff\u3400-\u4dbf]", char))
+    return _CHINESE_CHAR_RE.match(char) is not None
 
 
 def is_chinese_text(text: str) -> bool:
     """Check if text contains Chinese characters."""
-    return any(is_chinese_character(char) for char in text)
+    return _CHINESE_CHAR_RE.search(text) is not None
 
 
 def is_traditional_chinese(text: str) -> bool:
@@ -603,6 +526,7 @@ def is_traditional_chinese(text: str) -> bool:
     return any(char in traditional_indicators for char in text)
 
 
+@lru_cache(maxsize=65536)
 def convert_to_pinyin(text: str) -> str:
     """Convert Chinese text to pinyin."""
     if not HAS_PYPINYIN:
@@ -618,18 +542,13 @@ def convert_to_pinyin(text: str) -> str:
 
 def extract_chinese_surnames(text: str) -> list[str]:
     """Extract potential Chinese surnames from text."""
-    surnames = []
-
     # Check for Chinese character surnames
-    for char in text:
-        if char in CHINESE_SURNAMES:
-            surnames.append(char)
+    surnames = [
+        char for char in _CHINESE_CHAR_RE.findall(text) if char in CHINESE_SURNAMES
+    ]
 
     # Check for romanized surnames
-    words = text.lower().split()
-    for word in words:
-        if word in ROMANIZED_SURNAMES:
-            surnames.append(word)
+    surnames.extend(word for word in text.lower().split() if word in ROMANIZED_SURNAMES)
 
     return surnames
 
@@ -642,7 +561,7 @@ def adjust_chinese_parsing(parsed: HumanName, name: str) -> HumanName:
     if is_chinese_text(name):
         # Chinese names typically have 2-3 characters total
         # Family name (1-2 chars) + given name (1-2 chars)
-        chinese_chars = [char for char in name if is_chinese_character(char)]
+        chinese_chars = "".join(_CHINESE_CHAR_RE.findall(name))
 
         if len(chinese_chars) == 2:
             # Likely: [surname][given_name]
@@ -654,22 +573,22 @@ def adjust_chinese_parsing(parsed: HumanName, name: str) -> HumanName:
             if chinese_chars[0] in CHINESE_SURNAMES:
                 # Single character surname
                 parsed.last = chinese_chars[0]
-                parsed.first = "".join(chinese_chars[1:])
+                parsed.first = chinese_chars[1:]
                 parsed.middle = ""
             else:
                 # Assume compound surname (less common but exists)
-                parsed.last = "".join(chinese_chars[:2])
+                parsed.last = chinese_chars[:2]
                 parsed.first = chinese_chars[2]
                 parsed.middle = ""
         elif len(chinese_chars) == 4:
             # Likely compound surname + compound given name
-            parsed.last = "".join(chinese_chars[:2])
-            parsed.first = "".join(chinese_chars[2:])
+            parsed.last = chinese_chars[:2]
+            parsed.first = chinese_chars[2:]
             parsed.middle = ""
         elif len(chinese_chars) >= 5:
             # Very long name, take first 2 as surname, rest as given name
-            parsed.last = "".join(chinese_chars[:2])
-            parsed.first = "".join(chinese_chars[2:])
+            parsed.last = chinese_chars[:2]
+            parsed.first = chinese_chars[2:]
             parsed.middle = ""
     else:
         # Handle romanized Chinese names
@@ -713,6 +632,40 @@ def adjust_chinese_parsing(parsed: HumanName, name: str) -> HumanName:
     return parsed
 
 
+# Common romanization variants of Chinese surnames
+_ROMANIZATION_VARIANTS = {
+    "wong": "wang",
+    "lee": "li",
+    "chang": "zhang",
+    "lau": "liu",
+    "chan": "chen",
+    "yeung": "yang",
+    "chiu": "zhao",
+    "chow": "zhou",
+    "ng": "wu",
+    "tsui": "xu",
+    "soon": "sun",
+    "chu": "zhu",
+    "mah": "ma",
+    "woo": "hu",
+    "kwok": "guo",
+    "lam": "lin",
+    "ho": "he",
+    "ko": "gao",
+    "leung": "liang",
+    "cheng": "zheng",
+    "law": "luo",
+    "sung": "song",
+    "tse": "xie",
+    "tong": "tang",
+    "hon": "han",
+    "tso": "cao",
+    "hui": "xu",
+    "tang": "deng",
+    "siu": "xiao",
+}
+
+
 def normalize_chinese_surname(surname: str) -> str:
     """Normalize Chinese surname by handling variants and romanizations."""
     if not surname:
@@ -721,55 +674,25 @@ def normalize_chinese_surname(surname: str) -> str:
     # Convert to lowercase for romanized names
     normalized = surname.lower()
 
-    # Handle common romanization variants
-    romanization_variants = {
-        "wong": "wang",
-        "lee": "li",
-        "chang": "zhang",
-        "lau": "liu",
-        "chan": "chen",
-        "yeung": "yang",
-        "chiu": "zhao",
-        "chow": "zhou",
-        "ng": "wu",
-        "tsui": "xu",
-        "soon": "sun",
-        "chu": "zhu",
-        "mah": "ma",
-        "woo": "hu",
-        "kwok": "guo",
-        "lam": "lin",
-        "ho": "he",
-        "ko": "gao",
-        "leung": "liang",
-        "cheng": "zheng",
-        "law": "luo",
-        "sung": "song",
-        "tse": "xie",
-        "tong": "tang",
-        "hon": "han",
-        "tso": "cao",
-        "hui": "xu",
-        "tang": "deng",
-        "siu": "xiao",
-    }
-
-    return romanization_variants.get(normalized, normalized)
+    return _ROMANIZATION_VARIANTS.get(normalized, normalized)
 
 
 def calculate_chinese_similarity(name1: str, name2: str) -> float:
     """Calculate similarity between Chinese names with special handling."""
     from .utils import calculate_distance
 
+    chinese1 = is_chinese_text(name1)
+    chinese2 = is_chinese_text(name2)
+
     # If both are Chinese characters, use character-based comparison
-    if is_chinese_text(name1) and is_chinese_text(name2):
+    if chinese1 and chinese2:
         # Direct character comparison
         if name1 == name2:
             return 1.0
 
         # Character-by-character similarity
-        chars1 = [char for char in name1 if is_chinese_character(char)]
-        chars2 = [char for char in name2 if is_chinese_character(char)]
+        chars1 = "".join(_CHINESE_CHAR_RE.findall(name1))
+        chars2 = "".join(_CHINESE_CHAR_RE.findall(name2))
 
         if not chars1 or not chars2:
             return 0.0
@@ -786,17 +709,17 @@ def calculate_chinese_similarity(name1: str, name2: str) -> float:
         jaccard_score = intersection / union
 
         # Also consider sequence similarity
-        sequence_score = calculate_distance("".join(chars1), "".join(chars2))
+        sequence_score = calculate_distance(chars1, chars2)
 
         # Combine both scores
         return max(jaccard_score * 0.7 + sequence_score * 0.3, sequence_score)
 
     # If one is Chinese and one is romanized, convert to pinyin
-    elif is_chinese_text(name1) and not is_chinese_text(name2):
+    elif chinese1 and not chinese2:
         pinyin1 = convert_to_pinyin(name1)
         return calculate_distance(pinyin1, name2.lower())
 
-    elif not is_chinese_text(name1) and is_chinese_text(name2):
+    elif not chinese1 and chinese2:
         pinyin2 = convert_to_pinyin(name2)
         return calculate_distance(name1.lower(), pinyin2)
 
@@ -816,7 +739,7 @@ def get_chinese_name_score(name: str) -> float:
     words = name.split()
 
     # Check for Chinese characters
-    chinese_char_count = sum(1 for char in name if is_chinese_character(char))
+    chinese_char_count = len(_CHINESE_CHAR_RE.findall(name))
     if chinese_char_count > 0:
         score += min(chinese_char_count / len(name), 1.0) * 0.8
 
@@ -834,9 +757,8 @@ def get_chinese_name_score(name: str) -> float:
                 score += 0.1
 
     # Length patterns typical of Chinese names
-    if is_chinese_text(name):
-        char_count = len([c for c in name if is_chinese_character(c)])
-        if 2 <= char_count <= 4:
+    if chinese_char_count:
+        if 2 <= chinese_char_count <= 4:
             score += 0.2
     else:
         # Romanized names often have 2-3 syllables
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import unicodedata
 from pathlib import Path
 from typing import Any
 from dataclasses import dataclass, field
@@ -33,7 +34,7 @@ from .mandarin import (
     normalize_chinese_surname,
     calculate_chinese_similarity,
 )
-from .language_detection import detect_language
+from .language_detection import detect_language, detect_languages
 from .utils import (
     calculate_distance,
     calculate_statistical_similarity,
@@ -224,6 +225,10 @@ class NameMatcher:
         """Detect the most likely language of a name."""
         return detect_language(name)
 
+    def detect_languages(self, names: list[str]) -> list[Language]:
+        """Detect the most likely language of each name in a batch."""
+        return detect_languages(names)
+
     def segment_name(
         self, name: str, language: Language | None = None
     ) -> NameComponents:
@@ -332,7 +337,7 @@ class NameMatcher:
 
         return " ".join(cleaned_words)
 
-    def expand_diminutives(self, name: str, language: Language) -> list[str]:
+    def expand_diminutives(self, name: str, language: Language) -> frozenset[str]:
         """Generate possible full names from diminutives."""
         return expand_diminutives(name, language, self.data_dir)
 
@@ -358,8 +363,11 @@ class NameMatcher:
         if threshold is None:
             threshold = self.config.thresholds.default_match_threshold
 
-        # Handle exact matches first
-        if name1.strip().lower() == name2.strip().lower():
+        # Handle exact matches first, folding compatibility forms such as Arabic
+        # ligatures and presentation forms to their base letters
+        folded1 = unicodedata.normalize("NFKC", name1).strip().lower()
+        folded2 = unicodedata.normalize("NFKC", name2).strip().lower()
+        if folded1 == folded2:
             components1 = self.segment_name(name1, language1)
             components2 = self.segment_name(name2, language2)
 
@@ -381,8 +389,8 @@ class NameMatcher:
             )
 
         # Handle hyphenated variations
-        name1_normalized = name1.strip().lower().replace("-", " ").replace("  ", " ")
-        name2_normalized = name2.strip().lower().replace("-", " ").replace("  ", " ")
+        name1_normalized = folded1.replace("-", " ").replace("  ", " ")
+        name2_normalized = folded2.replace("-", " ").replace("  ", " ")
 
         if name1_normalized == name2_normalized:
             components1 = self.segment_name(name1, language1)
@@ -443,18 +451,18 @@ class NameMatcher:
 
         # Use language-specific similarity functions for whole name comparison
         if (
-            components1.language == Language.ARABIC
-            or components2.language == Language.ARABIC
+            components1.language is Language.ARABIC
+            or components2.language is Language.ARABIC
         ):
             whole_name_similarity = calculate_arabic_similarity(full_name1, full_name2)
         elif (
-            components1.language == Language.RUSSIAN
-            or components2.language == Language.RUSSIAN
+            components1.language is Language.RUSSIAN
+            or components2.language is Language.RUSSIAN
         ):
             whole_name_similarity = calculate_russian_similarity(full_name1, full_name2)
         elif (
-            components1.language == Language.MANDARIN
-            or components2.language == Language.MANDARIN
+            components1.language is Language.MANDARIN
+            or components2.language is Language.MANDARIN
         ):
             whole_name_similarity = calculate_chinese_similarity(full_name1, full_name2)
         else:
@@ -675,11 +683,11 @@ class NameMatcher:
             return 0.0
 
         # Use language-specific similarity functions
-        if lang1 == Language.ARABIC or lang2 == Language.ARABIC:
+        if lang1 is Language.ARABIC or lang2 is Language.ARABIC:
             direct_score = calculate_arabic_similarity(name1, name2)
-        elif lang1 == Language.RUSSIAN or lang2 == Language.RUSSIAN:
+        elif lang1 is Language.RUSSIAN or lang2 is Language.RUSSIAN:
             direct_score = calculate_russian_similarity(name1, name2)
-        elif lang1 == Language.MANDARIN or lang2 == Language.MANDARIN:
+        elif lang1 is Language.MANDARIN or lang2 is Language.MANDARIN:
             direct_score = calculate_chinese_similarity(name1, name2)
         else:
             direct_score = self.calculate_distance(name1, name2)
@@ -750,18 +758,22 @@ class NameMatcher:
         all_variants1.update(variants1)
         all_variants2.update(variants2)
 
-        if lang1 != lang2:
+        if lang1 is not lang2:
             for lang in Language:
-                if lang != lang1:
+                if lang is not lang1:
                     all_variants1.update(self.expand_diminutives(name1, lang))
-                if lang != lang2:
+                if lang is not lang2:
                     all_variants2.update(self.expand_diminutives(name2, lang))
 
         best_diminutive_score = direct_score
-        for v1 in all_variants1:
-            for v2 in all_variants2:
-                score = self.calculate_distance(v1, v2)
-                best_diminutive_score = max(best_diminutive_score, score)
+        if not all_variants1.isdisjoint(all_variants2):
+            # A shared variant is an exact match, the best any pair can score
+            best_diminutive_score = 1.0
+        else:
+            for v1 in all_variants1:
+                for v2 in all_variants2:
+                    score = self.calculate_distance(v1, v2)
+                    best_diminutive_score = max(best_diminutive_score, score)
 
         if (
             best_diminutive_score > direct_score
@@ -787,11 +799,11 @@ class NameMatcher:
         clean2 = self._normalize_surname(surname2, lang2)
 
         # Use language-specific similarity functions
-        if lang1 == Language.ARABIC or lang2 == Language.ARABIC:
+        if lang1 is Language.ARABIC or lang2 is Language.ARABIC:
             direct_score = calculate_arabic_similarity(clean1, clean2)
-        elif lang1 == Language.RUSSIAN or lang2 == Language.RUSSIAN:
+        elif lang1 is Language.RUSSIAN or lang2 is Language.RUSSIAN:
             direct_score = calculate_russian_similarity(clean1, clean2)
-        elif lang1 == Language.MANDARIN or lang2 == Language.MANDARIN:
+        elif lang1 is Language.MANDARIN or lang2 is Language.MANDARIN:
             direct_score = calculate_chinese_similarity(clean1, clean2)
         else:
             direct_score = self.calculate_distance(clean1, clean2)
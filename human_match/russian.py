@@ -6,62 +6,75 @@ import re
 
 from nameparser import HumanName
 
+from .utils import (
+    adjust_with_particles,
+    particle_regex,
+    split_at_particle,
+    strip_particles,
+)
+
 
 # Russian particles that should be included with surnames
-RUSSIAN_PARTICLES = {
-    "де",  # de (French origin)
-    "ван",  # van (Dutch origin)
-    "фон",  # von (German origin)
-    "ла",  # la (French origin)
-    "ле",  # le (French origin)
-    "дю",  # du (French origin)
-    # Romanized versions
-    "de",
-    "van",
-    "von",
-    "la",
-    "le",
-    "du",
-    "der",
-    "des",
-}
+RUSSIAN_PARTICLES = frozenset(
+    {
+        "де",  # de (French origin)
+        "ван",  # van (Dutch origin)
+        "фон",  # von (German origin)
+        "ла",  # la (French origin)
+        "ле",  # le (French origin)
+        "дю",  # du (French origin)
+        # Romanized versions
+        "de",
+        "van",
+        "von",
+        "la",
+        "le",
+        "du",
+        "der",
+        "des",
+    }
+)
+
+_RUSSIAN_PARTICLE_RE = particle_regex(RUSSIAN_PARTICLES)
 
 # Russian honorifics and titles
-RUSSIAN_HONORIFICS = {
-    "господин",  # Mr.
-    "госпожа",  # Mrs.
-    "товарищ",  # Comrade
-    "доктор",  # Doctor
-    "профессор",  # Professor
-    "академик",  # Academician
-    "генерал",  # General
-    "полковник",  # Colonel
-    "майор",  # Major
-    "капитан",  # Captain
-    "князь",  # Prince
-    "княгиня",  # Princess
-    "граф",  # Count
-    "графиня",  # Countess
-    "барон",  # Baron
-    "баронесса",  # Baroness
-    # Romanized versions
-    "gospodin",
-    "gospozha",
-    "tovarisch",
-    "doktor",
-    "professor",
-    "akademik",
-    "general",
-    "polkovnik",
-    "mayor",
-    "kapitan",
-    "knyaz",
-    "knyaginya",
-    "graf",
-    "grafinya",
-    "baron",
-    "baronessa",
-}
+RUSSIAN_HONORIFICS = frozenset(
+    {
+        "господин",  # Mr.
+        "госпожа",  # Mrs.
+        "товарищ",  # Comrade
+        "доктор",  # Doctor
+        "профессор",  # Professor
+        "академик",  # Academician
+        "генерал",  # General
+        "полковник",  # Colonel
+        "майор",  # Major
+        "капитан",  # Captain
+        "князь",  # Prince
+        "княгиня",  # Princess
+        "граф",  # Count
+        "графиня",  # Countess
+        "барон",  # Baron
+        "баронесса",  # Baroness
+        # Romanized versions
+        "gospodin",
+        "gospozha",
+        "tovarisch",
+        "doktor",
+        "professor",
+        "akademik",
+        "general",
+        "polkovnik",
+        "mayor",
+        "kapitan",
+        "knyaz",
+        "knyaginya",
+        "graf",
+        "grafinya",
+        "baron",
+        "baronessa",
+    }
+)
 
 
 def is_cyrillic_text(text: str) -> bool:
@@ -77,7 +90,7 @@ def normalize_cyrillic_text(text: str) -> str:
         return text
 
     # Remove extra spaces
-    normalized = re.sub(r"\s+", " ", text.strip())
+    normalized = " ".join(text.split())
 
     return normalized
 
@@ -156,19 +169,7 @@ def adjust_russian_parsing(parsed: HumanName, name: str) -> HumanName:
 
             if normalized_word in RUSSIAN_PARTICLES or word_lower in RUSSIAN_PARTICLES:
                 if i > 0:  # Particle not at the beginning
-                    # Everything from the particle onwards is the surname
-                    last_part = " ".join(words[i:])
-                    parsed.last = last_part
-                    # Everything before the particle is first/middle
-                    if i == 1:
-                        parsed.first = words[0]
-                        parsed.middle = ""
-                    elif i == 2:
-                        parsed.first = words[0]
-                        parsed.middle = words[1]
-                    else:
-                        parsed.first = " ".join(words[: i - 1])
-                        parsed.middle = words[i - 1]
+                    split_at_particle(parsed, words, i)
                     break
 
         # Handle Russian patronymic patterns (middle names ending in -ович/-евич/-ич for males, -овна/-евна/-ична for females)
@@ -194,22 +195,7 @@ def adjust_russian_parsing(parsed: HumanName, name: str) -> HumanName:
         # Handle romanized Russian names
         words = name.split()
         if len(words) >= 3:
-            for i, word in enumerate(words):
-                if word.lower() in RUSSIAN_PARTICLES and i > 0:
-                    # Everything from the particle onwards is the surname
-                    last_part = " ".join(words[i:])
-                    parsed.last = last_part
-                    # Everything before the particle is first/middle
-                    if i == 1:
-                        parsed.first = words[0]
-                        parsed.middle = ""
-                    elif i == 2:
-                        parsed.first = words[0]
-                        parsed.middle = words[1]
-                    else:
-                        parsed.first = " ".join(words[: i - 1])
-                        parsed.middle = words[i - 1]
-                    break
+            adjust_with_particles(parsed, name, RUSSIAN_PARTICLES)
 
             # Handle romanized patronymic patterns
             if len(words) == 3:
@@ -243,35 +229,13 @@ def normalize_russian_surname(surname: str) -> str:
     if is_cyrillic_text(surname):
         # Normalize Cyrillic text
         normalized = normalize_cyrillic_text(surname.lower())
-        words = normalized.split()
-
-        # Remove particles
-        filtered_words = []
-        for word in words:
-            if word not in RUSSIAN_PARTICLES:
-                filtered_words.append(word)
-
-        # If we removed everything, keep the original
-        if not filtered_words:
-            return normalized
-
-        return " ".join(filtered_words)
+        # Remove particles, keeping the original if nothing else is left
+        return strip_particles(normalized, _RUSSIAN_PARTICLE_RE)
     else:
         # Handle romanized Russian names
         normalized = surname.lower()
-        words = normalized.split()
-
-        # Remove particles from the beginning and keep track of the core name
-        filtered_words = []
-        for word in words:
-            if word not in RUSSIAN_PARTICLES:
-                filtered_words.append(word)
-
-        # If we removed everything, keep the original
-        if not filtered_words:
-            return normalized
-
-        return " ".join(filtered_words)
+        # Remove particles, keeping the original if nothing else is left
+        return strip_particles(normalized, _RUSSIAN_PARTICLE_RE)
 
 
 def calculate_russian_similarity(name1: str, name2: str) -> float:
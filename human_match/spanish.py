@@ -4,69 +4,77 @@ from __future__ import annotations
 
 from nameparser import HumanName
 
+from .utils import particle_regex, split_at_particle, strip_particles
+
 
 # Spanish particles that should be included with surnames
-SPANISH_PARTICLES = {
-    "de",
-    "del",
-    "de la",
-    "de las",
-    "de los",
-    "y",
-    "e",
-    "san",
-    "santa",
-    "santo",
-    "da",
-    "das",
-    "dos",
-    "do",
-}
+SPANISH_PARTICLES = frozenset(
+    {
+        "de",
+        "del",
+        "de la",
+        "de las",
+        "de los",
+        "y",
+        "e",
+        "san",
+        "santa",
+        "santo",
+        "da",
+        "das",
+        "dos",
+        "do",
+    }
+)
+
+_SPANISH_PARTICLE_RE = particle_regex(SPANISH_PARTICLES)
 
 # Spanish honorifics and titles
-SPANISH_HONORIFICS = {
-    "señor",
-    "señora",
-    "señorita",
-    "sr",
-    "sr.",
-    "sra",
-    "sra.",
-    "srta",
-    "srta.",
-    "don",
-    "doña",
-    "doctor",
-    "doctora",
-    "dr",
-    "dr.",
-    "dra",
-    "dra.",
-    "profesor",
-    "profesora",
-    "prof",
-    "prof.",
-    "ingeniero",
-    "ingeniera",
-    "ing",
-    "ing.",
-    "licenciado",
-    "licenciada",
-    "lic",
-    "lic.",
-    "arquitecto",
-    "arquitecta",
-    "arq",
-    "arq.",
-    "conde",
-    "condesa",
-    "duque",
-    "duquesa",
-    "marqués",
-    "marquesa",
-    "barón",
-    "baronesa",
-}
+SPANISH_HONORIFICS = frozenset(
+    {
+        "señor",
+        "señora",
+        "señorita",
+        "sr",
+        "sr.",
+        "sra",
+        "sra.",
+        "srta",
+        "srta.",
+        "don",
+        "doña",
+        "doctor",
+        "doctora",
+        "dr",
+        "dr.",
+        "dra",
+        "dra.",
+        "profesor",
+        "profesora",
+        "prof",
+        "prof.",
+        "ingeniero",
+        "ingeniera",
+        "ing",
+        "ing.",
+        "licenciado",
+        "licenciada",
+        "lic",
+        "lic.",
+        "arquitecto",
+        "arquitecta",
+        "arq",
+        "arq.",
+        "conde",
+        "condesa",
+        "duque",
+        "duquesa",
+        "marqués",
+        "marquesa",
+        "barón",
+        "baronesa",
+    }
+)
 
 
 def adjust_spanish_parsing(parsed: HumanName, name: str) -> HumanName:
@@ -83,34 +91,11 @@ def adjust_spanish_parsing(parsed: HumanName, name: str) -> HumanName:
                 if i < len(words) - 1:
                     two_word_particle = f"{word.lower()} {words[i + 1].lower()}"
                     if two_word_particle in SPANISH_PARTICLES:
-                        # Everything from the particle onwards is the surname
-                        last_part = " ".join(words[i:])
-                        parsed.last = last_part
-                        # Everything before the particle is first/middle
-                        if i == 1:
-                            parsed.first = words[0]
-                            parsed.middle = ""
-                        elif i == 2:
-                            parsed.first = words[0]
-                            parsed.middle = words[1]
-                        else:
-                            parsed.first = " ".join(words[: i - 1])
-                            parsed.middle = words[i - 1]
+                        split_at_particle(parsed, words, i)
                         break
 
                 # Single word particle
-                last_part = " ".join(words[i:])
-                parsed.last = last_part
-                # Everything before the particle is first/middle
-                if i == 1:
-                    parsed.first = words[0]
-                    parsed.middle = ""
-                elif i == 2:
-                    parsed.first = words[0]
-                    parsed.middle = words[1]
-                else:
-                    parsed.first = " ".join(words[: i - 1])
-                    parsed.middle = words[i - 1]
+                split_at_particle(parsed, words, i)
                 break
 
     return parsed
@@ -120,26 +105,6 @@ def normalize_spanish_surname(surname: str) -> str:
     """Normalize Spanish surname by removing particles."""
     # Handle apostrophes - remove for Spanish
     normalized = surname.lower().replace("'", "").replace("'", "")
-    words = normalized.split()
-
-    # Remove particles from the beginning and keep track of the core name
-    filtered_words = []
-    i = 0
-    while i < len(words):
-        word = words[i]
-        # Check for compound particles
-        if i < len(words) - 1:
-            two_word_particle = f"{word} {words[i + 1]}"
-            if two_word_particle in SPANISH_PARTICLES:
-                i += 2  # Skip both words
-                continue
-
-        if word not in SPANISH_PARTICLES:
-            filtered_words.append(word)
-        i += 1
-
-    # If we removed everything, keep the original
-    if not filtered_words:
-        return normalized
-
-    return " ".join(filtered_words)
+    # Remove particles (compound ones like "de la" first), keeping the
+    # original if nothing else is left
+    return strip_particles(normalized, _SPANISH_PARTICLE_RE)
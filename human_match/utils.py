@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Collection
 from functools import lru_cache
 
 import jellyfish
+from nameparser import HumanName
 from phonetics import dmetaphone, soundex
 from unidecode import unidecode
 
+try:
+    from rapidfuzz.distance import Jaro, JaroWinkler, Levenshtein
+
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
 
 @lru_cache(maxsize=1024)
 def phonetic_encoding(text: str, algorithm: str = "metaphone") -> str:
@@ -46,17 +55,22 @@ def calculate_distance(s1: str, s2: str, algorithm: str = "jaro_winkler") -> flo
         return 1.0
 
     match algorithm:
-        case "jaro_winkler":
-            return float(jellyfish.jaro_winkler_similarity(s1_norm, s2_norm))
         case "jaro":
+            if HAS_RAPIDFUZZ:
+                return float(Jaro.similarity(s1_norm, s2_norm))
             return float(jellyfish.jaro_similarity(s1_norm, s2_norm))
         case "levenshtein":
+            if HAS_RAPIDFUZZ:
+                return float(Levenshtein.normalized_similarity(s1_norm, s2_norm))
             max_len = max(len(s1_norm), len(s2_norm))
             if max_len == 0:
                 return 1.0
             dist = jellyfish.levenshtein_distance(s1_norm, s2_norm)
             return 1.0 - (float(dist) / max_len)
         case _:
+            # Jaro-Winkler is the default algorithm
+            if HAS_RAPIDFUZZ:
+                return float(JaroWinkler.similarity(s1_norm, s2_norm))
             return float(jellyfish.jaro_winkler_similarity(s1_norm, s2_norm))
 
 
@@ -165,3 +179,65 @@ def normalize_german_umlauts(text: str) -> str:
         result = result.replace(umlaut, replacement)
 
     return result
+
+
+def split_at_particle(parsed: HumanName, words: list[str], index: int) -> HumanName:
+    """Make the particle at ``index`` and everything after it the surname."""
+    # Everything from the particle onwards is the surname
+    parsed.last = " ".join(words[index:])
+    # Everything before the particle is first/middle
+    if index == 1:
+        parsed.first = words[0]
+        parsed.middle = ""
+    elif index == 2:
+        parsed.first = words[0]
+        parsed.middle = words[1]
+    else:
+        parsed.first = " ".join(words[: index - 1])
+        parsed.middle = words[index - 1]
+
+    return parsed
+
+
+def adjust_with_particles(
+    parsed: HumanName, name: str, particles: Collection[str]
+) -> HumanName:
+    """Adjust parsing so surname particles (e.g. "de", "von") join the surname."""
+    words = name.split()
+    if len(words) >= 3:
+        # Look for particles and combine them with the surname
+        index = find_particle_index(words, particles)
+        if index != -1:
+            return split_at_particle(parsed, words, index)
+
+    return parsed
+
+
+def find_particle_index(words: list[str], particles: Collection[str]) -> int:
+    """Return the index of the first particle after the first word, or -1."""
+    for i in range(1, len(words)):
+        if words[i].lower() in particles:
+            return i
+    return -1
+
+
+def particle_regex(particles: Collection[str]) -> re.Pattern[str]:
+    """Compile a regex matching any of ``particles`` as whole whitespace-delimited words.
+
+    Multi-word particles (e.g. "de la") match across any run of whitespace and,
+    being tried longest first, win over their single-word prefixes.
+    """
+    alternation = "|".join(
+        r"\s+".join(map(re.escape, particle.split()))
+        for particle in sorted(particles, key=lambda p: (-len(p), p))
+    )
+    return re.compile(rf"(?<!\S)(?:{alternation})(?!\S)")
+
+
+def strip_particles(text: str, particle_re: re.Pattern[str]) -> str:
+    """Remove particle words from text, keeping the text if nothing else is left."""
+    words = particle_re.sub("", text).split()
+    if not words:
+        return text
+
+    return " ".join(words)
@@ -25,12 +25,29 @@ class TestCoreAlgorithms:
             ("Muhammad Ahmed", Language.ARABIC),  # Arabic romanized
             ("محمد أحمد", Language.ARABIC),  # Arabic script
             ("António dos Santos", Language.PORTUGUESE),  # Portuguese with particles
+            ("Anna Konovalova", Language.RUSSIAN),  # Female form of a listed surname
+            ("Анна Коновалова", Language.RUSSIAN),
         ]
 
         for name, expected_lang in test_cases:
             detected_lang = self.matcher.detect_language(name)
             assert detected_lang == expected_lang, f"Failed for {name}"
 
+    def test_language_detection_batch(self) -> None:
+        """Test batch language detection."""
+        names = ["John Smith", "Wolfgang Schröder", "John Smith", "João Silva"]
+
+        detected = self.matcher.detect_languages(names)
+
+        assert detected == [self.matcher.detect_language(name) for name in names]
+        assert detected == [
+            Language.ENGLISH,
+            Language.GERMAN,
+            Language.ENGLISH,
+            Language.PORTUGUESE,
+        ]
+        assert self.matcher.detect_languages([]) == []
+
     def test_name_segmentation(self) -> None:
         """Test name segmentation algorithm."""
         test_cases = [
@@ -239,6 +256,24 @@ def test_distance_algorithms(algorithm: str) -> None:
     assert 0.5 < score < 1.0
 
 
+@pytest.mark.parametrize(
+    ("algorithm", "reference"),
+    [
+        ("jaro_winkler", "jaro_winkler_similarity"),
+        ("jaro", "jaro_similarity"),
+    ],
+)
+def test_distance_matches_jellyfish(algorithm: str, reference: str) -> None:
+    """The rapidfuzz and jellyfish paths agree on non-identical strings."""
+    jellyfish = pytest.importorskip("jellyfish")
+    pytest.importorskip("rapidfuzz")
+    matcher = NameMatcher()
+
+    score = matcher.calculate_distance("muhammad", "mohamed", algorithm)
+    assert score == getattr(jellyfish, reference)("muhammad", "mohamed")
+    assert score < 1.0
+
+
 @pytest.mark.parametrize("encoding", ["metaphone", "soundex"])
 def test_phonetic_algorithms(encoding: str) -> None:
     """Test different phonetic algorithms."""
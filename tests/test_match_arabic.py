@@ -2,6 +2,11 @@
 
 import pytest
 from human_match import NameMatcher, Language
+from human_match.arabic import (
+    batch_arabic_similarity,
+    calculate_arabic_similarity,
+    normalize_arabic_text,
+)
 
 
 class TestArabicNameMatching:
@@ -287,3 +292,58 @@ def test_parametrized_arabic_variants(
     matcher = NameMatcher()
     result = matcher.match_names(name1, name2, language1=Language.ARABIC)
     assert result["confidence"] >= expected_min
+
+
+def test_batch_arabic_similarity() -> None:
+    """Batch similarity matches pairwise similarity for every pair."""
+    queries = ["محمد", "Muhammad Ahmed", "عبدالله"]
+    candidates = ["مُحَمَّد", "Mohamed Ahmed", "عبد الله", "Omar"]
+
+    scores = batch_arabic_similarity(queries, candidates)
+
+    assert len(scores) == len(queries)
+    for query, row in zip(queries, scores):
+        assert row == [calculate_arabic_similarity(query, c) for c in candidates]
+    assert scores[0][0] == 1.0
+    assert batch_arabic_similarity([], candidates) == []
+
+
+@pytest.mark.parametrize(
+    "variant,base",
+    [
+        ("\ufdf2", "الله"),  # Allah ligature
+        ("\ufefb", "لا"),  # Lam-alef ligature
+        ("عبد \ufdf2", "عبد الله"),
+        ("\ufee3\ufea4\ufee4\ufeaa", "محمد"),  # Presentation forms
+        (
+            "\u0627\u0654\u062d\u0645\u062f",
+            "\u0623\u062d\u0645\u062f",
+        ),  # Decomposed hamza
+    ],
+)
+def test_arabic_compatibility_forms(variant: str, base: str) -> None:
+    """Ligatures, presentation forms and decomposed hamza fold to the base spelling."""
+    assert normalize_arabic_text(variant) == normalize_arabic_text(base)
+    assert calculate_arabic_similarity(variant, base) == 1.0
+
+
+@pytest.mark.parametrize(
+    "variant,base",
+    [
+        ("ﷲ", "الله"),  # Allah ligature
+        ("عبد ﷲ", "عبد الله"),
+        ("ﻣﺤﻤﺪ ﻋﻠﻲ", "محمد علي"),  # Presentation forms
+        (
+            "أحمد",
+            "أحمد",
+        ),  # Decomposed hamza
+    ],
+)
+def test_arabic_compatibility_forms_match(variant: str, base: str) -> None:
+    """Compatibility forms are detected as Arabic and match the base spelling."""
+    matcher = NameMatcher()
+
+    assert matcher.detect_language(variant) == Language.ARABIC
+    result = matcher.match_names(variant, base)
+    assert result["confidence"] == 1.0
+    assert result["name1"].language == Language.ARABIC